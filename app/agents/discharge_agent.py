@@ -3,26 +3,28 @@ from app.services.llm_client import llm_json_call
 
 
 class DischargeAgent(BaseAgent):
+    PROMPT_HEADER = (
+        "You are an agent that extracts structured data from a hospital discharge summary.\n"
+        "Return strict JSON only with this schema:\n"
+        "{\n"
+        "  \"patient_name\": string | null,\n"
+        "  \"hospital_name\": string | null,\n"
+        "  \"admission_date\": string | null,\n"
+        "  \"discharge_date\": string | null,\n"
+        "  \"primary_diagnosis\": string | null,\n"
+        "  \"secondary_diagnoses\": [string],\n"
+        "  \"procedures\": [string],\n"
+        "  \"attending_physician\": string | null\n"
+        "}\n"
+        "Rules:\n"
+        "- Respond with valid JSON only, no explanations.\n"
+        "- Use null for missing or unknown values.\n"
+        "- Use ISO-like date strings when possible (e.g., 2024-01-31).\n\n"
+        "Document text:\n"
+    )
+
     async def parse(self, text: str) -> dict:
-        prompt = (
-            "You are an agent that extracts structured data from a hospital discharge summary.\n"
-            "Return strict JSON only with this schema:\n"
-            "{\n"
-            "  \"patient_name\": string | null,\n"
-            "  \"hospital_name\": string | null,\n"
-            "  \"admission_date\": string | null,\n"
-            "  \"discharge_date\": string | null,\n"
-            "  \"primary_diagnosis\": string | null,\n"
-            "  \"secondary_diagnoses\": [string],\n"
-            "  \"procedures\": [string],\n"
-            "  \"attending_physician\": string | null\n"
-            "}\n"
-            "Rules:\n"
-            "- Respond with valid JSON only, no explanations.\n"
-            "- Use null for missing or unknown values.\n"
-            "- Use ISO-like date strings when possible (e.g., 2024-01-31).\n\n"
-            f"Document text:\n{text[:4000]}"
-        )
+        prompt = self.PROMPT_HEADER + text[:4000]
         result = await llm_json_call(prompt)
 
         if result.get("llm_error"):
@@ -0,0 +1,38 @@
+from app.agents.base import BaseAgent
+from app.agents.bill_agent import BillAgent
+from app.agents.discharge_agent import DischargeAgent
+from app.agents.id_agent import IDAgent
+from app.agents.pharmacy_agent import PharmacyAgent
+
+
+AGENT_CLASSES: dict[str, type[BaseAgent]] = {
+    "bill": BillAgent,
+    "discharge_summary": DischargeAgent,
+    "id_card": IDAgent,
+    "pharmacy_bill": PharmacyAgent,
+}
+
+_agents: dict[str, BaseAgent] = {}
+
+
+def get_agent(doc_type: str) -> BaseAgent | None:
+    """
+    Return the shared agent for doc_type, building it on first use.
+    Agents are stateless, so one instance per type serves all requests.
+    """
+    agent = _agents.get(doc_type)
+    if agent is None:
+        agent_cls = AGENT_CLASSES.get(doc_type)
+        if agent_cls is None:
+            # claim_form or other → no dedicated agent yet
+            return None
+        agent = _agents[doc_type] = agent_cls()
+    return agent
+
+
+def warm_up_agents() -> None:
+    """
+    Build every registered agent ahead of the first request.
+    """
+    for doc_type in AGENT_CLASSES:
+        get_agent(doc_type)
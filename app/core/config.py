@@ -4,6 +4,9 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     OPENAI_API_KEY: str | None = None
     OPENAI_MODEL: str = "gpt-4o-mini"
+    # Idle seconds before a pooled OpenAI connection is dropped; keep this
+    # above the expected gap between claims so warm connections survive.
+    LLM_KEEPALIVE_EXPIRY: float = 300.0
 
     class Config:
         env_file = ".env"
@@ -1,12 +1,37 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.responses import HTMLResponse
 
+from app.agents.registry import warm_up_agents
 from app.api.routes import router as api_router
+from app.services.llm_client import (
+    close_http_client,
+    open_http_client,
+    warm_up_llm_client,
+)
+from app.utils.pdf_utils import warm_up_pdf_backend
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Pre-warm agents, the PDF backend and the LLM connection pool so the
+    first request after a cold start does not pay for them.
+    """
+    warm_up_agents()
+    warm_up_pdf_backend()
+    await open_http_client()
+    await warm_up_llm_client()
+    yield
+    await close_http_client()
+
 
 app = FastAPI(
     title="Superclaims Backend Assignment",
     description="LLM-powered medical claim document processing API.",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import httpx
 
@@ -6,6 +7,101 @@ from app.core.config import settings
 
 
 OPENAI_API_URL = "https://api.openai.com/v1/chat/completions"
+OPENAI_MODELS_URL = "https://api.openai.com/v1/models"
+
+WARMUP_TIMEOUT = 2.0
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+_transport: httpx.AsyncBaseTransport | None = None
+
+
+def _build_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=30.0,
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=settings.LLM_KEEPALIVE_EXPIRY,
+        ),
+        transport=_transport,
+    )
+
+
+def set_http_transport(transport: httpx.AsyncBaseTransport | None) -> None:
+    """
+    Route all LLM calls through transport (e.g. a mock for benchmarks).
+    """
+    global _transport
+    _transport = transport
+
+
+async def open_http_client() -> httpx.AsyncClient:
+    """
+    Create the shared AsyncClient for the running event loop (called from
+    the app lifespan). Its pooled connections keep TLS sessions to OpenAI
+    alive across requests.
+    """
+    global _client, _client_loop
+    await close_http_client()
+    _client = _build_client()
+    _client_loop = asyncio.get_running_loop()
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared AsyncClient, if one is open."""
+    global _client, _client_loop
+    client = _shared_client()
+    # A client left over from a finished loop cannot be closed; drop it.
+    _client, _client_loop = None, None
+    if client is not None:
+        await client.aclose()
+
+
+def _shared_client() -> httpx.AsyncClient | None:
+    """
+    Return the shared client only if it belongs to the running event loop;
+    pooled connections cannot be reused from a different loop.
+    """
+    if (
+        _client is not None
+        and not _client.is_closed
+        and _client_loop is asyncio.get_running_loop()
+    ):
+        return _client
+    return None
+
+
+async def warm_up_llm_client() -> None:
+    """
+    Open a connection to the OpenAI API ahead of the first claim so the
+    DNS lookup and TLS handshake are not paid on the request path.
+    Skipped without an API key; bounded by WARMUP_TIMEOUT so an unreachable
+    API cannot stall startup. Any error is ignored; warm-up is best effort.
+    """
+    client = _shared_client()
+    if client is None or not settings.OPENAI_API_KEY:
+        return
+    try:
+        await asyncio.wait_for(
+            client.get(
+                OPENAI_MODELS_URL,
+                headers={"Authorization": f"Bearer {settings.OPENAI_API_KEY}"},
+            ),
+            timeout=WARMUP_TIMEOUT,
+        )
+    except Exception:
+        pass
+
+
+async def _post(headers: dict, body: dict) -> httpx.Response:
+    client = _shared_client()
+    if client is not None:
+        return await client.post(OPENAI_API_URL, headers=headers, json=body)
+    # No lifespan-managed client for this loop: use a short-lived one.
+    async with _build_client() as client:
+        return await client.post(OPENAI_API_URL, headers=headers, json=body)
 
 
 async def llm_json_call(prompt: str) -> dict:
@@ -34,10 +130,9 @@ async def llm_json_call(prompt: str) -> dict:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.post(OPENAI_API_URL, headers=headers, json=body)
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await _post(headers, body)
+        resp.raise_for_status()
+        data = resp.json()
 
         content = data["choices"][0]["message"]["content"]
 
@@ -11,10 +11,7 @@ from app.models.schemas import (
 from app.services.validation import run_validation
 from app.utils.pdf_utils import pdf_to_text
 from app.services.llm_client import llm_json_call
-from app.agents.bill_agent import BillAgent
-from app.agents.discharge_agent import DischargeAgent
-from app.agents.id_agent import IDAgent
-from app.agents.pharmacy_agent import PharmacyAgent
+from app.agents.registry import get_agent
 
 
 async def classify_document(text: str) -> str:
@@ -68,18 +65,9 @@ async def classify_document(text: str) -> str:
 
 def get_agent_for_doc_type(doc_type: str):
     """
-    Map doc_type to specific agent class.
+    Map doc_type to its shared agent instance from the registry.
     """
-    if doc_type == "bill":
-        return BillAgent()
-    if doc_type == "discharge_summary":
-        return DischargeAgent()
-    if doc_type == "id_card":
-        return IDAgent()
-    if doc_type == "pharmacy_bill":
-        return PharmacyAgent()
-    # claim_form or other → no dedicated agent yet
-    return None
+    return get_agent(doc_type)
 
 
 async def process_claims(files: List[UploadFile]) -> ClaimResponse:
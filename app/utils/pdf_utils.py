@@ -1,5 +1,26 @@
 from io import BytesIO
-from pypdf import PdfReader
+
+
+_pdf_reader_cls = None
+
+
+def _get_pdf_reader_cls():
+    """
+    Import pypdf on first use so it does not add to app import time.
+    """
+    global _pdf_reader_cls
+    if _pdf_reader_cls is None:
+        from pypdf import PdfReader
+
+        _pdf_reader_cls = PdfReader
+    return _pdf_reader_cls
+
+
+def warm_up_pdf_backend() -> None:
+    """
+    Load the PDF backend ahead of the first request (called at app startup).
+    """
+    _get_pdf_reader_cls()
 
 
 async def pdf_to_text(content: bytes) -> str:
@@ -8,7 +29,7 @@ async def pdf_to_text(content: bytes) -> str:
     """
     try:
         buffer = BytesIO(content)
-        reader = PdfReader(buffer)
+        reader = _get_pdf_reader_cls()(buffer)
         texts: list[str] = []
 
         for page in reader.pages:
@@ -0,0 +1,92 @@
+"""
+Cold-start benchmark for the SuperClaims API.
+
+Reports, for a fresh interpreter:
+- the time to import `app.main` (and whether pypdf was loaded by it);
+- the time for app startup (lifespan warm-up) on its own;
+- the time for the first successful `POST /process-claim` against a mock LLM.
+
+The fixture PDF is built in a subprocess so this process does not import
+pypdf before the lifespan runs, and the benchmark's own imports happen
+outside the timed regions.
+
+Usage (from the project root):
+    python scripts/startup_benchmark.py
+"""
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+_BUILD_PDF = """
+import sys
+from io import BytesIO
+from pypdf import PdfWriter
+
+writer = PdfWriter()
+writer.add_blank_page(width=612, height=792)
+buffer = BytesIO()
+writer.write(buffer)
+sys.stdout.buffer.write(buffer.getvalue())
+"""
+
+
+def _blank_pdf() -> bytes:
+    return subprocess.run(
+        [sys.executable, "-c", _BUILD_PDF], check=True, capture_output=True
+    ).stdout
+
+
+def _mock_llm_handler(request):
+    import httpx
+
+    content = json.dumps({"doc_type": "other", "patient_name": "John Doe"})
+    return httpx.Response(
+        200,
+        json={"choices": [{"message": {"role": "assistant", "content": content}}]},
+    )
+
+
+def main() -> None:
+    pdf = _blank_pdf()
+
+    import_start = time.perf_counter()
+    from app.main import app
+    import_time = time.perf_counter() - import_start
+    pypdf_loaded_by_import = "pypdf" in sys.modules
+
+    import httpx
+    from fastapi.testclient import TestClient
+
+    from app.services.llm_client import set_http_transport
+
+    set_http_transport(httpx.MockTransport(_mock_llm_handler))
+    files = [
+        ("files", ("bill.pdf", pdf, "application/pdf")),
+        ("files", ("discharge.pdf", pdf, "application/pdf")),
+        ("files", ("id_card.pdf", pdf, "application/pdf")),
+    ]
+
+    startup_start = time.perf_counter()
+    with TestClient(app) as client:
+        startup_time = time.perf_counter() - startup_start
+        request_start = time.perf_counter()
+        resp = client.post("/process-claim", files=files)
+        request_time = time.perf_counter() - request_start
+
+    resp.raise_for_status()
+
+    print(f"import app.main:            {import_time * 1000:8.1f} ms")
+    print(f"pypdf loaded by import:     {pypdf_loaded_by_import}")
+    print(f"startup (lifespan):         {startup_time * 1000:8.1f} ms")
+    print(f"first /process-claim:       {request_time * 1000:8.1f} ms")
+    print(f"total to first 200:         {(import_time + startup_time + request_time) * 1000:8.1f} ms")
+    print(f"claim status:               {resp.json()['claim_decision']['status']}")
+
+
+if __name__ == "__main__":
+    main()
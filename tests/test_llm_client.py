@@ -0,0 +1,124 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from app.main import app, lifespan
+from app.services import llm_client
+
+
+@pytest.fixture(autouse=True)
+def reset_llm_client():
+    yield
+    llm_client._client = None
+    llm_client._client_loop = None
+    llm_client._transport = None
+
+
+class _ChatHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        payload = json.dumps(
+            {"choices": [{"message": {"content": json.dumps({"ok": 1})}}]}
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def chat_server(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ChatHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+    monkeypatch.setattr(llm_client, "OPENAI_API_URL", f"http://{host}:{port}/")
+    yield
+    server.shutdown()
+    server.server_close()
+
+
+def test_llm_json_call_across_event_loops(chat_server):
+    assert asyncio.run(llm_json_call_twice()) == [{"ok": 1}, {"ok": 1}]
+    assert asyncio.run(llm_client.llm_json_call("hi")) == {"ok": 1}
+    assert asyncio.run(llm_json_call_twice()) == [{"ok": 1}, {"ok": 1}]
+
+
+async def llm_json_call_twice():
+    await llm_client.open_http_client()
+    try:
+        return [
+            await llm_client.llm_json_call("hi"),
+            await llm_client.llm_json_call("hi"),
+        ]
+    finally:
+        await llm_client.close_http_client()
+
+
+def test_shared_client_not_reused_from_another_loop(chat_server):
+    asyncio.run(llm_client.open_http_client())
+
+    async def call_then_close():
+        try:
+            return await llm_client.llm_json_call("hi")
+        finally:
+            await llm_client.close_http_client()
+
+    assert asyncio.run(call_then_close()) == {"ok": 1}
+    assert llm_client._client is None
+
+
+def test_client_keeps_default_pool_limits():
+    async def pool_limits():
+        client = llm_client._build_client()
+        try:
+            pool = client._transport._pool
+            return pool._max_connections, pool._max_keepalive_connections
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(pool_limits()) == (100, 20)
+
+
+def test_warm_up_skipped_without_api_key(monkeypatch):
+    monkeypatch.setattr(llm_client.settings, "OPENAI_API_KEY", None)
+    requested = []
+    llm_client.set_http_transport(httpx.MockTransport(requested.append))
+
+    async def run():
+        await llm_client.open_http_client()
+        await llm_client.warm_up_llm_client()
+        await llm_client.close_http_client()
+
+    asyncio.run(run())
+    assert requested == []
+
+
+def test_lifespan_warm_up_bounded_by_timeout(monkeypatch):
+    monkeypatch.setattr(llm_client.settings, "OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(llm_client, "WARMUP_TIMEOUT", 0.2)
+
+    async def stalled(request):
+        await asyncio.sleep(10)
+        return httpx.Response(200)
+
+    llm_client.set_http_transport(httpx.MockTransport(stalled))
+
+    async def run():
+        async with lifespan(app):
+            pass
+
+    start = time.perf_counter()
+    asyncio.run(run())
+    assert time.perf_counter() - start < 0.2 + 1.0
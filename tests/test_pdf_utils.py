@@ -0,0 +1,31 @@
+import asyncio
+import sys
+from io import BytesIO
+
+from pypdf import PdfWriter
+
+from app.utils import pdf_utils
+
+
+def _blank_pdf() -> bytes:
+    writer = PdfWriter()
+    writer.add_blank_page(width=612, height=792)
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def test_pdf_to_text_imports_pypdf_lazily(monkeypatch):
+    content = _blank_pdf()
+    for name in [m for m in sys.modules if m == "pypdf" or m.startswith("pypdf.")]:
+        monkeypatch.delitem(sys.modules, name)
+    monkeypatch.setattr(pdf_utils, "_pdf_reader_cls", None)
+
+    assert asyncio.run(pdf_utils.pdf_to_text(content)) == "EMPTY_PDF_TEXT"
+    assert "pypdf" in sys.modules
+
+
+def test_pdf_to_text_reports_parse_errors():
+    assert asyncio.run(pdf_utils.pdf_to_text(b"not a pdf")).startswith(
+        "PDF_PARSE_ERROR"
+    )
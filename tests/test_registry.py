@@ -0,0 +1,13 @@
+from app.agents.bill_agent import BillAgent
+from app.agents.registry import get_agent
+
+
+def test_get_agent_returns_shared_instance():
+    agent = get_agent("bill")
+    assert isinstance(agent, BillAgent)
+    assert get_agent("bill") is agent
+
+
+def test_get_agent_returns_none_without_dedicated_agent():
+    assert get_agent("claim_form") is None
+    assert get_agent("other") is None